@@ -1,9 +1,20 @@
 import os
-from flask import Flask, render_template_string, request, jsonify
+import io
+import csv
+import json
+import time
+import codecs
+import hashlib
+import threading
+import contextlib
+import click
+from flask import Flask, Response, render_template, request, jsonify
+from flask_compress import Compress
 from dotenv import load_dotenv
 from pinecone import Pinecone, ServerlessSpec
-from openai import OpenAI
+from openai import OpenAI, APITimeoutError
 import uuid
+import urllib3
 import random
 from docx import Document
 from langchain.chat_models import ChatOpenAI
@@ -13,8 +24,18 @@ from langchain.callbacks import get_openai_callback
 from langsmith import trace, Client
 import functools
 
+try:
+    import fcntl
+except ImportError:  # Windows: fall back to in-process locking only
+    fcntl = None
+
 app = Flask(__name__)
 
+# Static assets are cache-busted by content hash, so browsers may keep them for a year
+app.config['SEND_FILE_MAX_AGE_DEFAULT'] = 31536000
+app.config['COMPRESS_ALGORITHM'] = ['br', 'gzip']
+Compress(app)
+
 # Load environment variables
 load_dotenv()
 
@@ -227,16 +248,108 @@ EXAMPLE_QUESTIONS = [
     "What advantages does the Festool Trigger Clamp offer for quick release and one-handed use?"
 ]
 
-def generate_embedding(text):
-    response = openai_client.embeddings.create(
+# Warm answer cache for example questions and popular logged queries
+WARM_CACHE_PATH = os.getenv('WARM_CACHE_PATH', 'warm_cache.json')
+POPULAR_QUERIES_PATH = os.getenv('POPULAR_QUERIES_PATH', 'popular_queries.txt')
+WARM_CACHE_ON_STARTUP = os.getenv('WARM_CACHE_ON_STARTUP', 'false').lower() == 'true'
+WARM_CACHE_REFRESH_ON_CHANGE = os.getenv('WARM_CACHE_REFRESH_ON_CHANGE', 'true').lower() == 'true'
+WARM_CACHE_DEBOUNCE_SECONDS = float(os.getenv('WARM_CACHE_DEBOUNCE_SECONDS', '30'))
+WARM_CACHE_STALE_GRACE_SECONDS = float(os.getenv('WARM_CACHE_STALE_GRACE_SECONDS', '900'))
+WARM_UP_LEASE_SECONDS = float(os.getenv('WARM_UP_LEASE_SECONDS', '600'))
+
+# The cache file is shared between workers: 'generation' counts content changes,
+# 'entries_generation' is the generation the entries were computed for and 'claim'
+# is the lease of the worker currently running a warm-up pass
+warm_cache = {'generation': 0, 'entries_generation': 0, 'changed_at': 0, 'claim': None, 'entries': {}}
+warm_cache_signature = None
+warm_cache_persisted = True
+warm_cache_lock = threading.Lock()
+warm_up_running = threading.Lock()
+startup_warm_up_started = False
+
+# Bulk product import/export
+PRODUCT_FIELDS = ['id', 'title', 'tags', 'link']
+EMBEDDING_BATCH_SIZE = 100
+UPSERT_BATCH_SIZE = 100
+DELETE_BATCH_SIZE = 1000
+FETCH_BATCH_SIZE = 100
+
+# Catalog version for /products ETags, bumped on every product change in this process.
+# The TTL bounds how long changes made by other instances can go unnoticed.
+PRODUCTS_CACHE_TTL = float(os.getenv('PRODUCTS_CACHE_TTL', '60'))
+
+# Pinecone is eventually consistent, so a rebuild this soon after a write may miss it
+PRODUCTS_SETTLE_SECONDS = 10
+
+catalog_version = 0
+catalog_changed_at = float('-inf')
+products_cache = {'version': None, 'body': None, 'etag': None, 'expires': 0}
+products_cache_lock = threading.Lock()
+
+# Per-route request deadlines in seconds
+ROUTE_DEADLINES = {
+    'query': float(os.getenv('QUERY_DEADLINE_SECONDS', '20')),
+}
+
+# Remaining budget needed before starting an optional stage of get_answer
+PRODUCTS_STAGE_MIN_SECONDS = 3
+REFINEMENT_STAGE_MIN_SECONDS = 5
+
+# Below this remaining budget a failed OpenAI call is not worth retrying
+RETRY_MIN_SECONDS = 10
+
+def remaining_budget(deadline):
+    if deadline is None:
+        return None
+    return max(deadline - time.monotonic(), 0)
+
+# Errors raised when an OpenAI or Pinecone (urllib3) call runs past its timeout
+DEADLINE_ERRORS = (APITimeoutError, urllib3.exceptions.TimeoutError)
+
+def has_budget(deadline, seconds):
+    return deadline is None or remaining_budget(deadline) >= seconds
+
+def deadline_options(deadline):
+    if deadline is None:
+        return {}
+    options = {'timeout': remaining_budget(deadline)}
+    if not has_budget(deadline, RETRY_MIN_SECONDS):
+        options['max_retries'] = 0
+    return options
+
+def get_chat(deadline=None):
+    options = deadline_options(deadline)
+    if 'timeout' in options:
+        options['request_timeout'] = options.pop('timeout')
+    return ChatOpenAI(model_name="gpt-4o", temperature=0, **options)
+
+def generate_embedding(text, deadline=None):
+    client = openai_client.with_options(**deadline_options(deadline))
+    response = client.embeddings.create(
         model="text-embedding-ada-002",
         input=text
     )
     return response.data[0].embedding
 
+def generate_embeddings(texts):
+    embeddings = []
+    for i in range(0, len(texts), EMBEDDING_BATCH_SIZE):
+        response = openai_client.embeddings.create(
+            model="text-embedding-ada-002",
+            input=texts[i:i+EMBEDDING_BATCH_SIZE]
+        )
+        embeddings.extend(item.embedding for item in response.data)
+    return embeddings
+
+def product_field(value):
+    return '' if value is None else str(value).strip()
+
+def normalize_tags(tags):
+    return ', '.join(tag for tag in map(product_field, tags) if tag)
+
 def add_product(title, tags, link):
     product_id = str(uuid.uuid4())
-    tags_text = ', '.join(tags)
+    tags_text = normalize_tags(tags)
     embedding = generate_embedding(tags_text)
     
     metadata = {
@@ -248,33 +361,27 @@ def add_product(title, tags, link):
     product_index.upsert([(product_id, embedding, metadata)])
     return product_id
 
+def iter_products():
+    # Page through the ids and fetch them in batches; query() caps top_k at 1000 with metadata
+    for ids in product_index.list():
+        for i in range(0, len(ids), FETCH_BATCH_SIZE):
+            fetch_response = product_index.fetch(ids=ids[i:i+FETCH_BATCH_SIZE])
+            for product_id, vector in fetch_response['vectors'].items():
+                metadata = vector['metadata']
+                yield (product_id, metadata['title'], metadata['tags'], metadata['link'])
+
 def get_all_products():
-    total_vectors = product_index.describe_index_stats()['total_vector_count']
-    
-    if total_vectors == 0:
-        return []
-    
-    fetch_response = product_index.query(
-        vector=[0] * 1536,  # Dummy vector
-        top_k=total_vectors,
-        include_metadata=True
-    )
-    
-    products = []
-    for match in fetch_response['matches']:
-        metadata = match['metadata']
-        products.append((match['id'], metadata['title'], metadata['tags'], metadata['link']))
-    
-    return products
+    return list(iter_products())
 
-def query_products_for_keywords(keywords):
+def query_products_for_keywords(keywords, deadline=None):
     query_text = ', '.join(keywords)
-    query_embedding = generate_embedding(query_text)
+    query_embedding = generate_embedding(query_text, deadline)
     
     results = product_index.query(
         vector=query_embedding,
         top_k=5,
-        include_metadata=True
+        include_metadata=True,
+        _request_timeout=remaining_budget(deadline)
     )
     
     return [(match['id'], match['metadata']['title'], match['metadata']['tags'], match['metadata']['link']) 
@@ -284,7 +391,7 @@ def delete_product(product_id):
     product_index.delete(ids=[product_id])
 
 def update_product(product_id, title, tags, link):
-    tags_text = ', '.join(tags)
+    tags_text = normalize_tags(tags)
     embedding = generate_embedding(tags_text)
     
     metadata = {
@@ -303,6 +410,103 @@ def get_product_by_id(product_id):
         return (product_id, metadata['title'], metadata['tags'], metadata['link'])
     return None
 
+def read_product_rows(file, file_format):
+    lines = codecs.iterdecode(file.stream, 'utf-8-sig')
+    if file_format == 'csv':
+        # Line 1 is the header row
+        for line_number, row in enumerate(csv.DictReader(lines), start=2):
+            yield line_number, row
+    else:
+        for line_number, line in enumerate(lines, start=1):
+            if not line.strip():
+                continue
+            try:
+                yield line_number, json.loads(line)
+            except ValueError:
+                yield line_number, None
+
+def sync_products(rows, prune=False):
+    existing = {product_id: (title, tags, link) for product_id, title, tags, link in get_all_products()}
+    ids_by_link = {link: product_id for product_id, (_, _, link) in existing.items()}
+    report = {'added': 0, 'updated': 0, 'unchanged': 0, 'deleted': 0, 'embedded': 0, 'written': 0,
+              'failed': False, 'errors': []}
+    
+    to_embed = []
+    to_restamp = []
+    seen = set()
+    for line_number, row in rows:
+        if not isinstance(row, dict):
+            report['errors'].append(f"Row {line_number}: invalid record")
+            continue
+        title = product_field(row.get('title'))
+        link = product_field(row.get('link'))
+        if not title or not link:
+            report['errors'].append(f"Row {line_number}: title and link are required")
+            continue
+        tags = row.get('tags')
+        if not isinstance(tags, list):
+            tags = product_field(tags).split(',')
+        tags_text = normalize_tags(tags)
+        if not tags_text:
+            # The tags are what gets embedded, and OpenAI rejects empty input
+            report['errors'].append(f"Row {line_number}: tags are required")
+            continue
+        
+        product_id = product_field(row.get('id')) or ids_by_link.get(link) or str(uuid.uuid4())
+        if product_id in seen:
+            report['errors'].append(f"Row {line_number}: duplicate product {product_id}")
+            continue
+        seen.add(product_id)
+        ids_by_link.setdefault(link, product_id)
+        
+        metadata = {
+            "title": title,
+            "tags": tags_text,
+            "link": link
+        }
+        current = existing.get(product_id)
+        if current is None:
+            to_embed.append((product_id, metadata))
+            report['added'] += 1
+        elif normalize_tags(current[1].split(',')) != tags_text:
+            to_embed.append((product_id, metadata))
+            report['updated'] += 1
+        elif current != (title, tags_text, link):
+            # Only the embedding of the tags matters, so keep the stored vector
+            to_restamp.append((product_id, metadata))
+            report['updated'] += 1
+        else:
+            report['unchanged'] += 1
+    
+    # Report how far a failed sync got; the route still invalidates caches for what was written
+    try:
+        for i in range(0, len(to_embed), EMBEDDING_BATCH_SIZE):
+            batch = to_embed[i:i+EMBEDDING_BATCH_SIZE]
+            embeddings = generate_embeddings([metadata['tags'] for _, metadata in batch])
+            report['embedded'] += len(embeddings)
+            vectors = [(product_id, embedding, metadata) for (product_id, metadata), embedding in zip(batch, embeddings)]
+            for j in range(0, len(vectors), UPSERT_BATCH_SIZE):
+                product_index.upsert(vectors[j:j+UPSERT_BATCH_SIZE])
+                report['written'] += len(vectors[j:j+UPSERT_BATCH_SIZE])
+        
+        for product_id, metadata in to_restamp:
+            product_index.update(id=product_id, set_metadata=metadata)
+            report['written'] += 1
+        
+        # A failed row may belong to an existing product, so never prune on a partial feed
+        if prune and report['errors']:
+            report['errors'].append("Prune skipped because some rows failed")
+        elif prune:
+            stale_ids = [product_id for product_id in existing if product_id not in seen]
+            for i in range(0, len(stale_ids), DELETE_BATCH_SIZE):
+                product_index.delete(ids=stale_ids[i:i+DELETE_BATCH_SIZE])
+                report['deleted'] += len(stale_ids[i:i+DELETE_BATCH_SIZE])
+    except Exception as e:
+        report['failed'] = True
+        report['errors'].append(f"Sync stopped after {report['written']} writes and {report['deleted']} deletes: {e}")
+    
+    return report
+
 def extract_text_from_docx(file):
     doc = Document(file)
     text = "\n".join([para.text for para in doc.paragraphs])
@@ -321,17 +525,18 @@ def upsert_transcript(transcript_text, metadata):
         chunk_metadata['chunk_id'] = f"{metadata['title']}_chunk_{i}"
         transcript_index.upsert([(chunk_metadata['chunk_id'], embedding, chunk_metadata)])
 
-def query_transcripts(query):
-    query_embedding = generate_embedding(query)
+def query_transcripts(query, deadline=None):
+    query_embedding = generate_embedding(query, deadline)
     result = transcript_index.query(
         vector=query_embedding,
         top_k=3,
-        include_metadata=True
+        include_metadata=True,
+        _request_timeout=remaining_budget(deadline)
     )
     return [(match['metadata']['title'], match['metadata']['text']) for match in result['matches']]
 
-def generate_keywords(text):
-    chat = ChatOpenAI(model_name="gpt-4o", temperature=0)
+def generate_keywords(text, deadline=None):
+    chat = get_chat(deadline)
     
     system_message = SystemMessage(content="You are a specialized keyword extraction system for woodworking terminology. Extract 3-5 highly relevant and specific keywords or short phrases from the given text, focusing on technical terms, tool names, or specific woodworking techniques.")
     human_message = HumanMessage(content=f"Generate keywords from this text: {text}")
@@ -343,59 +548,292 @@ def generate_keywords(text):
     keywords = response.content.strip().split(',')
     return [keyword.strip().lower() for keyword in keywords if keyword.strip()]
 
-def get_answer(context, user_query):
-    chat = ChatOpenAI(model_name="gpt-4o", temperature=0)
+def get_answer(context, user_query, deadline=None):
+    degraded = []
     
     system_message = SystemMessage(content="You are Jason Bent's woodworking expertise embodied in an AI. Answer the user's query based on the provided context, incorporating relevant product information without mentioning specific product names.")
     human_message = HumanMessage(content=f"Context: {context}\n\nQuestion: {user_query}")
     
     with trace(name="get_answer", run_type="chain"):
         with get_openai_callback() as cb:
-            response = chat([system_message, human_message])
+            response = get_chat(deadline)([system_message, human_message])
         initial_answer = response.content
         
-        query_keywords = generate_keywords(user_query)
-        answer_keywords = generate_keywords(initial_answer)
-        all_keywords = list(set(query_keywords + answer_keywords))
-        related_products = query_products_for_keywords(all_keywords)
+        # Products and refinement are optional: skip them rather than miss the deadline
+        all_keywords = []
+        related_products = []
+        # Hold back the refinement budget so a slow products stage cannot degrade both
+        products_deadline = None if deadline is None else deadline - REFINEMENT_STAGE_MIN_SECONDS
+        if has_budget(products_deadline, PRODUCTS_STAGE_MIN_SECONDS):
+            try:
+                query_keywords = generate_keywords(user_query, products_deadline)
+                answer_keywords = generate_keywords(initial_answer, products_deadline)
+                all_keywords = list(set(query_keywords + answer_keywords))
+                related_products = query_products_for_keywords(all_keywords, products_deadline)
+            except DEADLINE_ERRORS:
+                degraded.append('products')
+        else:
+            degraded.append('products')
+        
+        if not has_budget(deadline, REFINEMENT_STAGE_MIN_SECONDS):
+            degraded.append('refinement')
+            return initial_answer, related_products, all_keywords, degraded
         
         system_message_2 = SystemMessage(content="Refine the answer to incorporate product information without naming specific products. Ensure the response is comprehensive, reflects Jason's expertise, and includes specific techniques or advice.")
         human_message_2 = HumanMessage(content=f"Initial Answer: {initial_answer}\n\nRelated Products: {related_products}\n\nProvide a final answer.")
         
-        with get_openai_callback() as cb:
-            final_response = chat([system_message_2, human_message_2])
-        final_answer = final_response.content
+        try:
+            with get_openai_callback() as cb:
+                final_response = get_chat(deadline)([system_message_2, human_message_2])
+            final_answer = final_response.content
+        except DEADLINE_ERRORS:
+            degraded.append('refinement')
+            final_answer = initial_answer
     
-    return final_answer, related_products, all_keywords
+    return final_answer, related_products, all_keywords, degraded
 
-def process_query(query):
-    matches = query_transcripts(query)
-    if matches:
+def process_query(query, deadline=None):
+    try:
+        matches = query_transcripts(query, deadline)
+        if not matches:
+            return "I couldn't find a specific answer to your question. Please try rephrasing or ask something else.", [], None, []
         context = " ".join([f"Title: {title}\n{text}" for title, text in matches])
-        final_answer, related_products, keywords = get_answer(context, query)
-        
-        related_video = None
-        for title, _ in matches:
-            if title in YOUTUBE_LINKS:
-                related_video = YOUTUBE_LINKS[title].split("v=")[1].split("&")[0]
-                break
-        
-        return final_answer, related_products, related_video
+        final_answer, related_products, keywords, degraded = get_answer(context, query, deadline)
+    except DEADLINE_ERRORS:
+        return "Sorry, that question took too long to answer. Please try again.", [], None, ['answer']
+    
+    related_video = None
+    for title, _ in matches:
+        if title in YOUTUBE_LINKS:
+            related_video = YOUTUBE_LINKS[title].split("v=")[1].split("&")[0]
+            break
+    
+    return final_answer, related_products, related_video, degraded
+
+def normalize_query(query):
+    return ' '.join(query.lower().split())
+
+def load_warm_cache():
+    empty_cache = {'generation': 0, 'entries_generation': 0, 'changed_at': 0, 'claim': None, 'entries': {}}
+    if not os.path.exists(WARM_CACHE_PATH):
+        return empty_cache
+    try:
+        with open(WARM_CACHE_PATH, encoding='utf-8') as f:
+            cache = json.load(f)
+        if not isinstance(cache, dict) or not isinstance(cache.get('entries'), dict):
+            raise ValueError("missing 'entries'")
+    except (OSError, ValueError) as e:
+        app.logger.warning(f"Could not load warm cache: {e}")
+        return empty_cache
+    return {**empty_cache, **cache}
+
+def warm_cache_file_signature():
+    try:
+        stat = os.stat(WARM_CACHE_PATH)
+    except OSError:
+        return None
+    # os.replace gives every write a new inode, so this also catches writes within one mtime tick
+    return (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+
+def refresh_warm_cache(force=False):
+    # Pick up warm-ups and invalidations written by other workers or the CLI.
+    # If the file cannot be written, the in-memory copy is the only up-to-date state, so keep it.
+    global warm_cache_signature
+    signature = warm_cache_file_signature()
+    if signature != warm_cache_signature or (force and warm_cache_persisted):
+        warm_cache.clear()
+        warm_cache.update(load_warm_cache())
+        warm_cache_signature = signature
+
+def save_warm_cache(cache):
+    global warm_cache_signature, warm_cache_persisted
+    # Write to a temporary file first so readers never see a partial cache
+    tmp_path = WARM_CACHE_PATH + '.tmp'
+    try:
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(cache, f)
+        os.replace(tmp_path, WARM_CACHE_PATH)
+        warm_cache_signature = warm_cache_file_signature()
+        warm_cache_persisted = True
+    except OSError as e:
+        app.logger.warning(f"Could not persist warm cache: {e}")
+        warm_cache_persisted = False
+
+@contextlib.contextmanager
+def locked_warm_cache():
+    # Serialize read-modify-write of the cache file across threads and, where flock exists, processes
+    with warm_cache_lock:
+        lock_file = None
+        if fcntl is not None:
+            try:
+                lock_file = open(WARM_CACHE_PATH + '.lock', 'a')
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+            except OSError as e:
+                app.logger.warning(f"Could not lock warm cache: {e}")
+        try:
+            refresh_warm_cache(force=True)
+            yield warm_cache
+        finally:
+            if lock_file is not None:
+                lock_file.close()
+
+def get_popular_queries():
+    if not os.path.exists(POPULAR_QUERIES_PATH):
+        return []
+    with open(POPULAR_QUERIES_PATH, encoding='utf-8') as f:
+        return [line.strip() for line in f if line.strip() and not line.startswith('#')]
+
+def get_warm_queries():
+    queries = {}
+    for query in EXAMPLE_QUESTIONS + get_popular_queries():
+        queries.setdefault(normalize_query(query), query)
+    return list(queries.values())
+
+def get_warm_answer(query):
+    with warm_cache_lock:
+        refresh_warm_cache()
+        if warm_cache['entries_generation'] != warm_cache['generation']:
+            # Keep answering from the previous pass while a re-warm is on its way
+            refreshing = WARM_CACHE_REFRESH_ON_CHANGE and time.time() - warm_cache['changed_at'] < WARM_CACHE_STALE_GRACE_SECONDS
+            if not refreshing:
+                return None
+        return warm_cache['entries'].get(normalize_query(query))
+
+def claim_warm_up(force=False):
+    # Record a lease in the shared file so only one worker runs a warm-up pass at a time
+    with locked_warm_cache() as cache:
+        claim = cache['claim']
+        if claim and claim['expires'] > time.time():
+            return None
+        if not force and cache['entries'] and cache['entries_generation'] == cache['generation']:
+            return None
+        cache['claim'] = {'generation': cache['generation'], 'expires': time.time() + WARM_UP_LEASE_SECONDS}
+        save_warm_cache(cache)
+        return cache['generation']
+
+def warm_up_cache(force=False):
+    generation = claim_warm_up(force)
+    if generation is None:
+        return False
+    
+    entries = None
+    try:
+        entries = {}
+        for query in get_warm_queries():
+            answer, related_products, related_video, degraded = process_query(query)
+            entries[normalize_query(query)] = {
+                'answer': answer,
+                'related_products': related_products,
+                'related_video': related_video,
+                'degraded': degraded
+            }
+    finally:
+        with locked_warm_cache() as cache:
+            # Answers from a pass that content changes overtook are still newer than the previous ones
+            if entries is not None and generation >= cache['entries_generation']:
+                cache['entries'] = entries
+                cache['entries_generation'] = generation
+            cache['claim'] = None
+            save_warm_cache(cache)
+    return True
+
+def warm_up_in_background():
+    def worker():
+        try:
+            while True:
+                with warm_cache_lock:
+                    refresh_warm_cache()
+                    pending = not warm_cache['entries'] or warm_cache['entries_generation'] != warm_cache['generation']
+                    wait = warm_cache['changed_at'] + WARM_CACHE_DEBOUNCE_SECONDS - time.time()
+                if not pending:
+                    break
+                # Let a burst of admin edits settle into a single pass
+                if wait > 0:
+                    time.sleep(wait)
+                    continue
+                if not warm_up_cache():
+                    break
+        finally:
+            warm_up_running.release()
+    
+    if warm_up_running.acquire(blocking=False):
+        threading.Thread(target=worker, daemon=True).start()
+
+def invalidate_warm_cache():
+    with locked_warm_cache() as cache:
+        cache['generation'] += 1
+        cache['changed_at'] = time.time()
+        save_warm_cache(cache)
+    if WARM_CACHE_REFRESH_ON_CHANGE:
+        warm_up_in_background()
+
+def invalidate_products_cache():
+    global catalog_version, catalog_changed_at
+    with products_cache_lock:
+        catalog_version += 1
+        catalog_changed_at = time.monotonic()
+
+def get_products_payload():
+    with products_cache_lock:
+        if products_cache['version'] == catalog_version and time.monotonic() <= products_cache['expires']:
+            return products_cache['body'], products_cache['etag']
+        version = catalog_version
+    
+    body = jsonify({'products': get_all_products()}).get_data()
+    etag = hashlib.sha1(body).hexdigest()
+    
+    with products_cache_lock:
+        # Only cache a settled listing that no write has overtaken in the meantime
+        if version == catalog_version and time.monotonic() - catalog_changed_at >= PRODUCTS_SETTLE_SECONDS:
+            products_cache.update(version=version, body=body, etag=etag,
+                                  expires=time.monotonic() + PRODUCTS_CACHE_TTL)
+    return body, etag
+
+def etag_matches(etag):
+    if request.if_none_match.star_tag:
+        return True
+    # flask-compress appends ":<algorithm>" to the ETag of compressed responses
+    return any(tag.split(':')[0] == etag for tag in request.if_none_match.as_set())
+
+def static_version(filename):
+    with open(os.path.join(app.static_folder, filename), 'rb') as f:
+        return hashlib.md5(f.read()).hexdigest()[:8]
+
+@app.cli.command('warm-cache')
+def warm_cache_command():
+    """Precompute answers for the example questions and popular queries."""
+    queries = get_warm_queries()
+    if warm_up_cache(force=True):
+        click.echo(f"Warmed {len(queries)} queries into {WARM_CACHE_PATH}")
     else:
-        return "I couldn't find a specific answer to your question. Please try rephrasing or ask something else.", [], None
+        click.echo("Another worker is already warming the cache")
+
+@app.before_request
+def start_warm_up_on_first_request():
+    # Started from the first request rather than at import so `flask warm-cache` does not run a second warm-up
+    global startup_warm_up_started
+    if WARM_CACHE_ON_STARTUP and not startup_warm_up_started:
+        startup_warm_up_started = True
+        warm_up_in_background()
 
 @app.route('/')
 def index():
-    return render_template_string(HTML_TEMPLATE, example_questions=random.sample(EXAMPLE_QUESTIONS, 3))
+    return render_template(index_template, static_versions=static_versions,
+                           example_questions=random.sample(EXAMPLE_QUESTIONS, 3))
 
 @app.route('/query', methods=['POST'])
 def query():
     user_query = request.form['query']
-    answer, related_products, related_video = process_query(user_query)
+    cached = get_warm_answer(user_query)
+    if cached:
+        return jsonify(cached)
+    deadline = time.monotonic() + ROUTE_DEADLINES['query']
+    answer, related_products, related_video, degraded = process_query(user_query, deadline)
     return jsonify({
         'answer': answer,
         'related_products': related_products,
-        'related_video': related_video
+        'related_video': related_video,
+        'degraded': degraded
     })
 
 @app.route('/products', methods=['GET', 'POST'])
@@ -407,6 +845,8 @@ def manage_products():
             tags = request.form['tags'].split(',')
             link = request.form['link']
             product_id = add_product(title, tags, link)
+            invalidate_products_cache()
+            invalidate_warm_cache()
             return jsonify({'success': True, 'message': f'Product added with ID: {product_id}'})
         elif action == 'update':
             product_id = request.form['id']
@@ -414,14 +854,77 @@ def manage_products():
             tags = request.form['tags'].split(',')
             link = request.form['link']
             update_product(product_id, title, tags, link)
+            invalidate_products_cache()
+            invalidate_warm_cache()
             return jsonify({'success': True, 'message': f'Product updated: {product_id}'})
         elif action == 'delete':
             product_id = request.form['id']
             delete_product(product_id)
+            invalidate_products_cache()
+            invalidate_warm_cache()
             return jsonify({'success': True, 'message': f'Product deleted: {product_id}'})
     
-    products = get_all_products()
-    return jsonify({'products': products})
+    body, etag = get_products_payload()
+    if etag_matches(etag):
+        response = app.response_class(status=304)
+    else:
+        response = app.response_class(body, mimetype='application/json')
+    response.set_etag(etag)
+    # Let the admin panel reuse its copy after a cheap revalidation
+    response.headers['Cache-Control'] = 'no-cache'
+    return response
+
+@app.route('/products/import', methods=['POST'])
+def import_products():
+    if 'file' not in request.files:
+        return jsonify({'success': False, 'message': 'No file part'})
+    file = request.files['file']
+    if file.filename == '':
+        return jsonify({'success': False, 'message': 'No selected file'})
+    file_format = file.filename.rsplit('.', 1)[-1].lower()
+    if file_format not in ('csv', 'jsonl'):
+        return jsonify({'success': False, 'message': 'Invalid file format'})
+    
+    prune = request.form.get('prune', 'false').lower() == 'true'
+    try:
+        report = sync_products(read_product_rows(file, file_format), prune)
+    except UnicodeDecodeError:
+        return jsonify({'success': False, 'message': 'File is not valid UTF-8'})
+    except csv.Error as e:
+        return jsonify({'success': False, 'message': f'Invalid CSV file: {e}'})
+    if report['written'] or report['deleted']:
+        invalidate_products_cache()
+        invalidate_warm_cache()
+    status = 'Import failed' if report['failed'] else 'Import complete'
+    message = (f"{status}: {report['added']} added, {report['updated']} updated, "
+               f"{report['unchanged']} unchanged, {report['deleted']} deleted, {len(report['errors'])} errors")
+    return jsonify({'success': not report['failed'], 'message': message, **report})
+
+@app.route('/products/export')
+def export_products():
+    file_format = request.args.get('format', 'csv')
+    if file_format not in ('csv', 'jsonl'):
+        return jsonify({'success': False, 'message': 'Invalid file format'})
+    products = iter_products()
+    
+    def generate():
+        if file_format == 'csv':
+            buffer = io.StringIO()
+            writer = csv.writer(buffer)
+            writer.writerow(PRODUCT_FIELDS)
+            for product in products:
+                writer.writerow(product)
+                yield buffer.getvalue()
+                buffer.seek(0)
+                buffer.truncate(0)
+            yield buffer.getvalue()
+        else:
+            for product in products:
+                yield json.dumps(dict(zip(PRODUCT_FIELDS, product))) + '\n'
+    
+    mimetype = 'text/csv' if file_format == 'csv' else 'application/x-ndjson'
+    return Response(generate(), mimetype=mimetype,
+                    headers={'Content-Disposition': f'attachment; filename=products.{file_format}'})
 
 @app.route('/upload_transcript', methods=['POST'])
 def upload_transcript():
@@ -434,6 +937,7 @@ def upload_transcript():
         transcript_text = extract_text_from_docx(file)
         metadata = extract_metadata_from_text(transcript_text)
         upsert_transcript(transcript_text, metadata)
+        invalidate_warm_cache()
         return jsonify({'success': True, 'message': 'Transcript uploaded successfully'})
     return jsonify({'success': False, 'message': 'Invalid file format'})
 
@@ -442,15 +946,7 @@ HTML_TEMPLATE = """
 <html lang="en">
 <head>
     <!-- ... (previous head content remains the same) ... -->
-    <style>
-        /* ... (previous styles remain the same) ... */
-        footer {
-            text-align: center;
-            margin-top: 40px;
-            padding: 20px;
-            background-color: #ecf0f1;
-        }
-    </style>
+    <link rel="stylesheet" href="{{ url_for('static', filename='css/style.css', v=static_versions['css/style.css']) }}">
 </head>
 <body>
     <header>
@@ -518,6 +1014,15 @@ HTML_TEMPLATE = """
                 <input type="text" id="delete-id" placeholder="Product ID" required>
                 <button type="submit">Delete Product</button>
             </form>
+            <form id="import-products-form" enctype="multipart/form-data">
+                <h3>Bulk Import / Export</h3>
+                <input type="file" id="import-file" accept=".csv,.jsonl" required>
+                <label><input type="checkbox" id="import-prune"> Delete products missing from the file</label>
+                <button type="submit">Import Products</button>
+                <a href="/products/export?format=csv">Export CSV</a>
+                <a href="/products/export?format=jsonl">Export JSONL</a>
+            </form>
+            <div id="import-status"></div>
         </section>
 
         <section id="upload">
@@ -534,199 +1039,14 @@ HTML_TEMPLATE = """
         <p>Developed by KLM Solution</p>
     </footer>
 
-    <script>
-        document.addEventListener('DOMContentLoaded', function() {
-            const queryForm = document.getElementById('query-form');
-            const userQuery = document.getElementById('user-query');
-            const response = document.getElementById('response');
-            const chatHistory = document.getElementById('chat-history');
-            const exampleQuestions = document.querySelectorAll('.example-question');
-            const addProductForm = document.getElementById('add-product-form');
-            const updateProductForm = document.getElementById('update-product-form');
-            const deleteProductForm = document.getElementById('delete-product-form');
-            const uploadForm = document.getElementById('upload-form');
-            const uploadStatus = document.getElementById('upload-status');
-
-            function displayProducts(products) {
-                const productsList = document.getElementById('products-list');
-                productsList.innerHTML = '';
-                products.forEach(product => {
-                    const row = document.createElement('tr');
-                    row.innerHTML = `
-                        <td>${product[0]}</td>
-                        <td>${product[1]}</td>
-                        <td>${product[2]}</td>
-                        <td><a href="${product[3]}" target="_blank">${product[3]}</a></td>
-                        <td>
-                            <button onclick="editProduct('${product[0]}', '${product[1]}', '${product[2]}', '${product[3]}')">Edit</button>
-                            <button onclick="deleteProduct('${product[0]}')">Delete</button>
-                        </td>
-                    `;
-                    productsList.appendChild(row);
-                });
-            }
-
-            function loadProducts() {
-                fetch('/products')
-                    .then(response => response.json())
-                    .then(data => {
-                        displayProducts(data.products);
-                    });
-            }
-
-            loadProducts();
-
-            queryForm.addEventListener('submit', function(e) {
-                e.preventDefault();
-                fetchAnswer(userQuery.value);
-            });
-
-            exampleQuestions.forEach(button => {
-                button.addEventListener('click', function() {
-                    userQuery.value = this.textContent;
-                    fetchAnswer(this.textContent);
-                });
-            });
-
-            function fetchAnswer(query) {
-                fetch('/query', {
-                    method: 'POST',
-                    headers: {
-                        'Content-Type': 'application/x-www-form-urlencoded',
-                    },
-                    body: `query=${encodeURIComponent(query)}`
-                })
-                .then(response => response.json())
-                .then(data => {
-                    displayAnswer(query, data.answer, data.related_products, data.related_video);
-                });
-            }
-
-            function displayAnswer(question, answer, relatedProducts, relatedVideo) {
-                response.innerHTML = `
-                    <h3>Q: ${question}</h3>
-                    <p>${answer}</p>
-                    <h4>Related Products:</h4>
-                    <ul>
-                        ${relatedProducts.map(product => `<li><a href="${product[3]}" target="_blank">${product[1]}</a></li>`).join('')}
-                    </ul>
-                    ${relatedVideo ? `
-                        <h4>Related Video:</h4>
-                        <iframe width="560" height="315" src="https://www.youtube.com/embed/${relatedVideo}" frameborder="0" allow="accelerometer; autoplay; clipboard-write; encrypted-media; gyroscope; picture-in-picture" allowfullscreen></iframe>
-                    ` : ''}
-                `;
-                
-                const historyItem = document.createElement('div');
-                historyItem.innerHTML = `<h3>Q: ${question}</h3><p>${answer}</p>`;
-                chatHistory.insertBefore(historyItem, chatHistory.firstChild);
-            }
-
-            addProductForm.addEventListener('submit', function(e) {
-                e.preventDefault();
-                const title = document.getElementById('new-title').value;
-                const tags = document.getElementById('new-tags').value;
-                const link = document.getElementById('new-link').value;
-                
-                fetch('/products', {
-                    method: 'POST',
-                    headers: {
-                        'Content-Type': 'application/x-www-form-urlencoded',
-                    },
-                    body: `action=add&title=${encodeURIComponent(title)}&tags=${encodeURIComponent(tags)}&link=${encodeURIComponent(link)}`
-                })
-                .then(response => response.json())
-                .then(data => {
-                    alert(data.message);
-                    loadProducts();
-                });
-            });
-
-            updateProductForm.addEventListener('submit', function(e) {
-                e.preventDefault();
-                const id = document.getElementById('update-id').value;
-                const title = document.getElementById('update-title').value;
-                const tags = document.getElementById('update-tags').value;
-                const link = document.getElementById('update-link').value;
-                
-                fetch('/products', {
-                    method: 'POST',
-                    headers: {
-                        'Content-Type': 'application/x-www-form-urlencoded',
-                    },
-                    body: `action=update&id=${encodeURIComponent(id)}&title=${encodeURIComponent(title)}&tags=${encodeURIComponent(tags)}&link=${encodeURIComponent(link)}`
-                })
-                .then(response => response.json())
-                .then(data => {
-                    alert(data.message);
-                    loadProducts();
-                });
-            });
-
-            deleteProductForm.addEventListener('submit', function(e) {
-                e.preventDefault();
-                const id = document.getElementById('delete-id').value;
-                
-                fetch('/products', {
-                    method: 'POST',
-                    headers: {
-                        'Content-Type': 'application/x-www-form-urlencoded',
-                    },
-                    body: `action=delete&id=${encodeURIComponent(id)}`
-                })
-                .then(response => response.json())
-                .then(data => {
-                    alert(data.message);
-                    loadProducts();
-                });
-            });
-
-            uploadForm.addEventListener('submit', function(e) {
-                e.preventDefault();
-                const file = document.getElementById('transcript-file').files[0];
-                const formData = new FormData();
-                formData.append('file', file);
-                
-                fetch('/upload_transcript', {
-                    method: 'POST',
-                    body: formData
-                })
-                .then(response => response.json())
-                .then(data => {
-                    uploadStatus.textContent = data.message;
-                });
-            });
-
-            function editProduct(id, title, tags, link) {
-                document.getElementById('update-id').value = id;
-                document.getElementById('update-title').value = title;
-                document.getElementById('update-tags').value = tags;
-                document.getElementById('update-link').value = link;
-            }
-
-            function deleteProduct(id) {
-                if (confirm('Are you sure you want to delete this product?')) {
-                    fetch('/products', {
-                        method: 'POST',
-                        headers: {
-                            'Content-Type': 'application/x-www-form-urlencoded',
-                        },
-                        body: `action=delete&id=${encodeURIComponent(id)}`
-                    })
-                    .then(response => response.json())
-                    .then(data => {
-                        alert(data.message);
-                        loadProducts();
-                    });
-                }
-            }
-
-            // Initial load of products
-            loadProducts();
-        });
-    </script>
+    <script src="{{ url_for('static', filename='js/app.js', v=static_versions['js/app.js']) }}"></script>
 </body>
 </html>
 """
 
+# Compile the index template and hash the static assets once at startup
+index_template = app.jinja_env.from_string(HTML_TEMPLATE)
+static_versions = {filename: static_version(filename) for filename in ['css/style.css', 'js/app.js']}
+
 if __name__ == '__main__':
     app.run(debug=True)
\ No newline at end of file
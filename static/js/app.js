@@ -0,0 +1,208 @@
+document.addEventListener('DOMContentLoaded', function() {
+    const queryForm = document.getElementById('query-form');
+    const userQuery = document.getElementById('user-query');
+    const response = document.getElementById('response');
+    const chatHistory = document.getElementById('chat-history');
+    const exampleQuestions = document.querySelectorAll('.example-question');
+    const addProductForm = document.getElementById('add-product-form');
+    const updateProductForm = document.getElementById('update-product-form');
+    const deleteProductForm = document.getElementById('delete-product-form');
+    const importProductsForm = document.getElementById('import-products-form');
+    const importStatus = document.getElementById('import-status');
+    const uploadForm = document.getElementById('upload-form');
+    const uploadStatus = document.getElementById('upload-status');
+
+    function displayProducts(products) {
+        const productsList = document.getElementById('products-list');
+        productsList.innerHTML = '';
+        products.forEach(product => {
+            const row = document.createElement('tr');
+            row.innerHTML = `
+                <td>${product[0]}</td>
+                <td>${product[1]}</td>
+                <td>${product[2]}</td>
+                <td><a href="${product[3]}" target="_blank">${product[3]}</a></td>
+                <td>
+                    <button onclick="editProduct('${product[0]}', '${product[1]}', '${product[2]}', '${product[3]}')">Edit</button>
+                    <button onclick="deleteProduct('${product[0]}')">Delete</button>
+                </td>
+            `;
+            productsList.appendChild(row);
+        });
+    }
+
+    function loadProducts() {
+        fetch('/products')
+            .then(response => response.json())
+            .then(data => {
+                displayProducts(data.products);
+            });
+    }
+
+    loadProducts();
+
+    queryForm.addEventListener('submit', function(e) {
+        e.preventDefault();
+        fetchAnswer(userQuery.value);
+    });
+
+    exampleQuestions.forEach(button => {
+        button.addEventListener('click', function() {
+            userQuery.value = this.textContent;
+            fetchAnswer(this.textContent);
+        });
+    });
+
+    function fetchAnswer(query) {
+        fetch('/query', {
+            method: 'POST',
+            headers: {
+                'Content-Type': 'application/x-www-form-urlencoded',
+            },
+            body: `query=${encodeURIComponent(query)}`
+        })
+        .then(response => response.json())
+        .then(data => {
+            displayAnswer(query, data.answer, data.related_products, data.related_video);
+        });
+    }
+
+    function displayAnswer(question, answer, relatedProducts, relatedVideo) {
+        response.innerHTML = `
+            <h3>Q: ${question}</h3>
+            <p>${answer}</p>
+            <h4>Related Products:</h4>
+            <ul>
+                ${relatedProducts.map(product => `<li><a href="${product[3]}" target="_blank">${product[1]}</a></li>`).join('')}
+            </ul>
+            ${relatedVideo ? `
+                <h4>Related Video:</h4>
+                <iframe width="560" height="315" src="https://www.youtube.com/embed/${relatedVideo}" frameborder="0" allow="accelerometer; autoplay; clipboard-write; encrypted-media; gyroscope; picture-in-picture" allowfullscreen></iframe>
+            ` : ''}
+        `;
+        
+        const historyItem = document.createElement('div');
+        historyItem.innerHTML = `<h3>Q: ${question}</h3><p>${answer}</p>`;
+        chatHistory.insertBefore(historyItem, chatHistory.firstChild);
+    }
+
+    addProductForm.addEventListener('submit', function(e) {
+        e.preventDefault();
+        const title = document.getElementById('new-title').value;
+        const tags = document.getElementById('new-tags').value;
+        const link = document.getElementById('new-link').value;
+        
+        fetch('/products', {
+            method: 'POST',
+            headers: {
+                'Content-Type': 'application/x-www-form-urlencoded',
+            },
+            body: `action=add&title=${encodeURIComponent(title)}&tags=${encodeURIComponent(tags)}&link=${encodeURIComponent(link)}`
+        })
+        .then(response => response.json())
+        .then(data => {
+            alert(data.message);
+            loadProducts();
+        });
+    });
+
+    updateProductForm.addEventListener('submit', function(e) {
+        e.preventDefault();
+        const id = document.getElementById('update-id').value;
+        const title = document.getElementById('update-title').value;
+        const tags = document.getElementById('update-tags').value;
+        const link = document.getElementById('update-link').value;
+        
+        fetch('/products', {
+            method: 'POST',
+            headers: {
+                'Content-Type': 'application/x-www-form-urlencoded',
+            },
+            body: `action=update&id=${encodeURIComponent(id)}&title=${encodeURIComponent(title)}&tags=${encodeURIComponent(tags)}&link=${encodeURIComponent(link)}`
+        })
+        .then(response => response.json())
+        .then(data => {
+            alert(data.message);
+            loadProducts();
+        });
+    });
+
+    deleteProductForm.addEventListener('submit', function(e) {
+        e.preventDefault();
+        const id = document.getElementById('delete-id').value;
+        
+        fetch('/products', {
+            method: 'POST',
+            headers: {
+                'Content-Type': 'application/x-www-form-urlencoded',
+            },
+            body: `action=delete&id=${encodeURIComponent(id)}`
+        })
+        .then(response => response.json())
+        .then(data => {
+            alert(data.message);
+            loadProducts();
+        });
+    });
+
+    importProductsForm.addEventListener('submit', function(e) {
+        e.preventDefault();
+        const file = document.getElementById('import-file').files[0];
+        const formData = new FormData();
+        formData.append('file', file);
+        formData.append('prune', document.getElementById('import-prune').checked);
+        
+        fetch('/products/import', {
+            method: 'POST',
+            body: formData
+        })
+        .then(response => response.json())
+        .then(data => {
+            importStatus.textContent = data.message;
+            loadProducts();
+        });
+    });
+
+    uploadForm.addEventListener('submit', function(e) {
+        e.preventDefault();
+        const file = document.getElementById('transcript-file').files[0];
+        const formData = new FormData();
+        formData.append('file', file);
+        
+        fetch('/upload_transcript', {
+            method: 'POST',
+            body: formData
+        })
+        .then(response => response.json())
+        .then(data => {
+            uploadStatus.textContent = data.message;
+        });
+    });
+
+    function editProduct(id, title, tags, link) {
+        document.getElementById('update-id').value = id;
+        document.getElementById('update-title').value = title;
+        document.getElementById('update-tags').value = tags;
+        document.getElementById('update-link').value = link;
+    }
+
+    function deleteProduct(id) {
+        if (confirm('Are you sure you want to delete this product?')) {
+            fetch('/products', {
+                method: 'POST',
+                headers: {
+                    'Content-Type': 'application/x-www-form-urlencoded',
+                },
+                body: `action=delete&id=${encodeURIComponent(id)}`
+            })
+            .then(response => response.json())
+            .then(data => {
+                alert(data.message);
+                loadProducts();
+            });
+        }
+    }
+
+    // Initial load of products
+    loadProducts();
+});